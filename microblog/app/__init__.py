@@ -1,30 +1,79 @@
-from flask import Flask
+from flask import Flask, current_app, request
+from jinja2 import FileSystemBytecodeCache
 from config import Config
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.record_queries import get_recorded_queries
 from flask_migrate import Migrate
 
-#__name__ is Python predefined variable which is set to the name of the module in which it is used
-# Flask uses the location of the module passed here as a starting point when it needs to load associated resources such as template files
-# The app variable is defined as an instance of class Flask in the __init__.py script, which makes it a member of the app package.
-app = Flask(__name__)
-
-# Tell Flask to read the config file and apply it
-app.config.from_object(Config)
-
+# Extension instances are created without an application, and attached to it in create_app() with init_app()
 # Database instance
-db = SQLAlchemy(app)
+db = SQLAlchemy()
 # Database migration engine instance
-migrate = Migrate(app, db)
+migrate = Migrate()
+
+# Warn about requests running too many queries (typically an N+1 pattern) and about slow queries
+def _log_slow_queries(response):
+    queries = get_recorded_queries()
+    if len(queries) > current_app.config['MAX_QUERIES_PER_REQUEST']:
+        current_app.logger.warning('%d queries for %s', len(queries), request.path)
+    for query in queries:
+        if query.duration > current_app.config['SLOW_QUERY_THRESHOLD']:
+            current_app.logger.warning('Slow query (%.3fs) at %s: %s', query.duration, query.location, query.statement)
+    return response
+
+# Application factory: builds and configures the Flask application instance
+def create_app(config_class=Config):
+    #__name__ is Python predefined variable which is set to the name of the module in which it is used
+    # Flask uses the location of the module passed here as a starting point when it needs to load associated resources such as template files
+    app = Flask(__name__)
+
+    # Tell Flask to read the config file and apply it
+    app.config.from_object(config_class)
+
+    # Outside of debug mode templates do not change while the server runs
+    # (Flask already disables template auto-reload there, unless TEMPLATES_AUTO_RELOAD is set):
+    # -> cache_size sets how many compiled templates are kept in memory
+    # -> the bytecode cache stores compiled templates on disk so other workers/restarts don't recompile them
+    # These options are read when the Jinja environment is created, so they must be set before app.jinja_env is first used
+    if not app.debug:
+        app.jinja_options = dict(app.jinja_options,
+                                 cache_size=400,
+                                 bytecode_cache=FileSystemBytecodeCache())
+
+    # The connection pool options depend on the database finally configured (the config class may override SQLALCHEMY_DATABASE_URI)
+    # Options explicitly set in SQLALCHEMY_ENGINE_OPTIONS take precedence
+    if not app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = dict(app.config.get('DATABASE_POOL_OPTIONS', {}),
+                                                       **app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+
+    # In debug mode, Flask-SQLAlchemy records the queries run by each request (must be set before db.init_app)
+    app.config.setdefault('SQLALCHEMY_RECORD_QUERIES', app.debug)
+
+    db.init_app(app)
+    migrate.init_app(app, db)
+
+    if app.config['SQLALCHEMY_RECORD_QUERIES']:
+        app.after_request(_log_slow_queries)
+
+    # The routes handle the different URLs that the application supports.
+    # In Flask, handlers for the application routes are written as Python functions, called view functions.
+    # View functions are mapped to one or more route URLs so that Flask knows what logic
+    # to execute when a client requests a given URL.
+    # They are imported here, when the application is built, which avoids circular imports with this module
+    from app.routes import bp as main_bp
+    app.register_blueprint(main_bp)
+
+    # Outside of debug mode, all templates are compiled at startup (and kept in the template cache)
+    # instead of being compiled by the first request rendering them
+    if not app.debug:
+        for name in app.jinja_env.list_templates():
+            app.jinja_env.get_template(name)
+
+    return app
 
 # The bottom import is a well known workaround that avoids circular imports, a common problem with Flask applications. 
-# routes module needs to import the app variable defined in this script, so putting one of the reciprocal imports at the bottom 
+# models module needs to import the db variable defined in this script, so putting one of the reciprocal imports at the bottom
 # avoids the error that results from the mutual references between these two files.
-#
-# The routes handle the different URLs that the application supports. 
-# In Flask, handlers for the application routes are written as Python functions, called view functions. 
-# View functions are mapped to one or more route URLs so that Flask knows what logic 
-# to execute when a client requests a given URL.
-from app import routes
 
 # Module used to define the structure of database
-from app import models
\ No newline at end of file
+from app import models
@@ -1,10 +1,33 @@
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 import sqlalchemy as sqla # provides general purpose database functions and classes
 import sqlalchemy.orm as sqlo # provides support for using models
+from sqlalchemy.ext.compiler import compiles
 from app import db
 
-# Class to store users in the database
+# SQL expression giving the current UTC time, used as server default for timestamps
+# CURRENT_TIMESTAMP can't be used directly: SQLite only stores whole seconds, and PostgreSQL
+# stores the session local time (not UTC) in a 'timestamp without time zone' column
+class utcnow(sqla.sql.expression.FunctionElement):
+    type = sqla.DateTime()
+    inherit_cache = True
+
+@compiles(utcnow, 'postgresql')
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+# strftime('now') is UTC in SQLite; %f only gives milliseconds, padded to the
+# microseconds format SQLAlchemy uses to store datetime values in SQLite
+@compiles(utcnow, 'sqlite')
+def _sqlite_utcnow(element, compiler, **kw):
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+# Only SQLite and PostgreSQL are supported: for other databases (e.g. MySQL/MariaDB) creating the table fails
+# rather than storing local times or timestamps rounded to the second
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    raise sqla.exc.CompileError('No UTC timestamp expression defined for the {} database'.format(compiler.dialect.name))
+
 # Inherits from db.Model, a base class for all Flask-SQLAlchemy models
 # sqlo.Mapped[int] defines a type of column which is not nullable (can't be empty)
 # sqlo.Mapped[Optional[str]] defines a type of column that can be empty (Optional) 
@@ -17,7 +40,9 @@ class User(db.Model):
     id: sqlo.Mapped[int] = sqlo.mapped_column(primary_key=True)
     username: sqlo.Mapped[str] = sqlo.mapped_column(sqla.String(64), index=True, unique=True)
     email: sqlo.Mapped[str] = sqlo.mapped_column(sqla.String(120), index=True, unique=True)
-    pwd_hash: sqlo.Mapped[Optional[str]] = sqlo.mapped_column(sqla.String(256))    
+    # deferred: the password hash is only needed when checking a password,
+    # so it is not loaded with the rest of the user row (it is fetched on first access)
+    pwd_hash: sqlo.Mapped[Optional[str]] = sqlo.mapped_column(sqla.String(256), deferred=True)
     
     # Users' posts field: references values from the id column in the users table
     # WriteOnlyMapped defines posts as a collection type with Post objects inside.
@@ -32,11 +57,17 @@ class User(db.Model):
 class Post(db.Model):
     id: sqlo.Mapped[int] = sqlo.mapped_column(primary_key=True)
     body: sqlo.Mapped[str] = sqlo.mapped_column(sqla.String(140))
-    timestamp: sqlo.Mapped[datetime] = sqlo.mapped_column(index=True, default=lambda: datetime.now(timezone.utc))
+    # server_default: the timestamp (UTC) is set by the database when the row is inserted
+    timestamp: sqlo.Mapped[datetime] = sqlo.mapped_column(index=True, server_default=utcnow())
     user_id: sqlo.Mapped[int] = sqlo.mapped_column(sqla.ForeignKey(User.id), index=True)
 
     # Other side of the relationship between users and posts
     author: sqlo.Mapped[User] = sqlo.relationship(back_populates='posts')
 
     def __repr__(self):
-        return '<Post {}>'.format(self.body)
\ No newline at end of file
+        return '<Post {}>'.format(self.body)
+
+
+# Composite index used by the posts feed: rows are filtered by author (user_id) and ordered by newest first,
+# so the database can read them straight from the index in timestamp order instead of sorting them
+sqla.Index('ix_post_user_id_timestamp', Post.user_id, Post.timestamp.desc())
@@ -15,4 +15,24 @@ class Config:
     # Flask-SQLAlchemy configuration
     # 'SQLALCHEMY_DATABASE_URI' is a configuration variable obtained from 'DATABASE_URL' environment variable
     # If not defined, we configure a database named app.db located in the main directory of the application  (stored in the basedir variable)
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///' + os.path.join(basedir, 'app.db')
\ No newline at end of file
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///' + os.path.join(basedir, 'app.db')
+
+    # Connection pool options, added to SQLALCHEMY_ENGINE_OPTIONS (passed by Flask-SQLAlchemy to create_engine()) by create_app()
+    # -> pool_size / max_overflow: number of database connections kept open / allowed on top of them under load
+    # -> pool_timeout: seconds to wait for a free connection before giving up
+    # -> pool_pre_ping: test a connection before using it, so stale connections (e.g. after a database restart) are replaced
+    # -> pool_recycle: replace connections older than 30 minutes
+    # They are not used with SQLite databases, which have no server connections to manage
+    DATABASE_POOL_OPTIONS = {
+        'pool_size': 10,
+        'max_overflow': 20,
+        'pool_timeout': 30,
+        'pool_recycle': 1800,
+        'pool_pre_ping': True,
+    }
+
+    # Query monitoring (active when SQLALCHEMY_RECORD_QUERIES is enabled, by default in debug mode)
+    # -> a warning is logged for requests running more than MAX_QUERIES_PER_REQUEST queries
+    # -> and for every query slower than SLOW_QUERY_THRESHOLD seconds
+    MAX_QUERIES_PER_REQUEST = 10
+    SLOW_QUERY_THRESHOLD = 0.05
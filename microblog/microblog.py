@@ -1,3 +1,6 @@
 # Python top-level script that defines the Flask application instance
 
-from app import app
+from app import create_app
+
+# The app variable is the application instance used by the 'flask' command (and by WSGI servers)
+app = create_app()